@@ -3,50 +3,19 @@
 This file ensures deterministic test execution through random seed management.
 F1: Popper falsifiability criterion - random seed fixing.
 """
-import os
 import random
 
-import numpy as np
 import pytest
 
-# Random seed management - CRITICAL for reproducibility
-RANDOM_SEED = int(os.environ.get("RANDOM_SEED", "42"))
-TEST_SEED = int(os.environ.get("TEST_SEED", str(RANDOM_SEED)))
+from scripts._seeding import RANDOM_SEED, TEST_SEED, set_seed  # noqa: F401
 
+# Shared generator, rewound per test by seeded_rng instead of reallocated
+_RNG = random.Random(TEST_SEED)
 
-def set_seed(seed: int) -> None:
-    """Set all random seeds for reproducibility.
 
-    F1 Criterion: Random seed management for Popperian falsifiability.
-    """
-    random.seed(seed)
-    np.random.seed(seed)
-    os.environ["PYTHONHASHSEED"] = str(seed)
-
-    # TensorFlow seed (if available)
-    try:
-        import tensorflow as tf
-        tf.random.set_seed(seed)
-    except ImportError:
-        pass
-
-    # PyTorch seed (if available)
-    try:
-        import torch
-        torch.manual_seed(seed)
-        if torch.cuda.is_available():
-            torch.cuda.manual_seed_all(seed)
-            torch.backends.cudnn.deterministic = True
-            torch.backends.cudnn.benchmark = False
-    except ImportError:
-        pass
-
-
-@pytest.fixture(scope="session", autouse=True)
-def seed_everything():
-    """Fixture to set random seeds at session start."""
-    set_seed(TEST_SEED)
-    yield
+def pytest_configure(config):
+    """Set random seeds once, before any fixture is set up."""
+    set_seed(TEST_SEED, deterministic=True)
 
 
 @pytest.fixture
@@ -57,5 +26,9 @@ def reproducible_seed():
 
 @pytest.fixture
 def seeded_rng():
-    """Fixture providing a seeded random generator."""
-    return random.Random(TEST_SEED)
+    """Fixture providing a seeded random generator.
+
+    The same instance is reseeded for every test; do not share it across threads.
+    """
+    _RNG.seed(TEST_SEED)
+    return _RNG
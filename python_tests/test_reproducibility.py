@@ -0,0 +1,209 @@
+"""Tests for scripts/reproducibility.py."""
+import contextlib
+import hashlib
+import json
+import random
+import time
+
+import numpy as np
+import pytest
+
+from scripts import reproducibility
+from scripts.reproducibility import (
+    _fingerprint,
+    create_experiment_manifest,
+    save_experiment,
+    verify_reproducibility,
+)
+
+
+# Module-level so they can be pickled into spawned worker processes
+def seeded_draw():
+    return np.random.random(100)
+
+
+def hash_ordered():
+    return list({"alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"})
+
+
+def clock():
+    return time.perf_counter_ns()
+
+
+def test_fingerprint_numeric_list_matches_array():
+    assert _fingerprint([1.0, 2.0]) == _fingerprint(np.array([1.0, 2.0]))
+    assert isinstance(_fingerprint((1, 2, 3)), bytes)
+
+
+def test_fingerprint_includes_dtype_and_shape():
+    assert _fingerprint(np.array([1, 2])) != _fingerprint(np.array([1.0, 2.0]))
+    assert _fingerprint(np.zeros((2, 3))) != _fingerprint(np.zeros((3, 2)))
+
+
+def test_fingerprint_keeps_non_numeric_sequences_intact():
+    assert _fingerprint([1, "a"]) == [1, "a"]
+    assert _fingerprint([1, "a"]) != _fingerprint(["1", "a"])
+
+
+def test_fingerprint_does_not_hash_lossy_conversions():
+    assert _fingerprint([2**63, -1]) != _fingerprint([2**63 + 1, -1])
+    assert _fingerprint([0.1, 2**60 + 1]) != _fingerprint([0.1, 2**60])
+    assert _fingerprint([0.1, 2**60 + 1]) == [0.1, 2**60 + 1]
+
+
+def test_verify_reproducibility_sees_large_int_changes():
+    values = iter([2**60, 2**60 + 1])
+    assert not verify_reproducibility(lambda: [0.5, next(values)], n_runs=2)
+
+
+def test_fingerprint_passes_through_other_values():
+    ragged = [[1], [1, 2]]
+    assert _fingerprint(ragged) is ragged
+    assert _fingerprint({"a": 1}) == {"a": 1}
+    assert _fingerprint(np.array(["a", "b"])) == ["a", "b"]
+
+
+def test_checksum_ignores_params_order(monkeypatch):
+    monkeypatch.setattr(reproducibility, "_utc_timestamp", lambda: "2025-01-01T00-00-00.000000000Z")
+    first = create_experiment_manifest("exp", params={"a": 1, "b": {"c": [1, 2], "d": 2}})
+    second = create_experiment_manifest("exp", params={"b": {"d": 2, "c": [1, 2]}, "a": 1})
+    other = create_experiment_manifest("exp", params={"a": "1", "b": {"c": [1, 2], "d": 2}})
+    assert first["checksum"] == second["checksum"]
+    assert first["checksum"] != other["checksum"]
+
+
+def test_checksum_rejects_unserializable_params():
+    with pytest.raises(TypeError):
+        create_experiment_manifest("exp", params={"s": {"alpha", "beta"}})
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "orjson":
+        if reproducibility.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(reproducibility, "orjson", None)
+    return request.param
+
+
+def test_save_experiment_round_trip(tmp_path, serializer):
+    manifest = create_experiment_manifest("exp", params={"lr": 0.001, "name": "café"})
+    output_dir = tmp_path / "nested" / "experiments"
+
+    path = save_experiment(manifest, output_dir)
+
+    assert path.parent == output_dir
+    assert path.name == f"exp_{manifest['timestamp']}.json"
+    assert ":" not in path.name
+    assert json.loads(path.read_bytes()) == manifest
+
+
+def test_save_experiment_overwrites_existing_file(tmp_path, serializer):
+    manifest = create_experiment_manifest("exp", params={"values": list(range(1000))})
+    path = save_experiment(manifest, tmp_path)
+    manifest["params"] = {}
+    assert save_experiment(manifest, tmp_path) == path
+    assert json.loads(path.read_bytes())["params"] == {}
+
+
+def test_save_experiment_accepts_numpy_and_non_str_keys(tmp_path, serializer):
+    manifest = create_experiment_manifest(
+        "exp", params={1: "x", "lr": np.float64(0.1), "steps": np.int64(3)}
+    )
+    path = save_experiment(manifest, tmp_path)
+    assert json.loads(path.read_bytes())["params"] == {"1": "x", "lr": 0.1, "steps": 3}
+
+
+def test_checksum_verifies_from_saved_manifest(tmp_path, serializer):
+    manifest = create_experiment_manifest(
+        "exp",
+        params={
+            1: "x",
+            "lr": np.float64(0.1),
+            "decay": np.float32(0.1),
+            "steps": np.int64(3),
+            "shape": (2, 3),
+            "grid": np.arange(3),
+            "nested": {"b": [1.5, None], "a": True},
+        },
+    )
+    loaded = json.loads(save_experiment(manifest, tmp_path).read_bytes())
+
+    checksum = loaded.pop("checksum")
+    digest = hashlib.sha256()
+    reproducibility._update_digest(digest, loaded)
+    assert digest.hexdigest()[:16] == checksum == manifest["checksum"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {1: np.float64(0.5), "v": [1, None, True]},
+        {"y": np.float32(0.1), "h": np.float16(0.1), "a": np.array([0.1, 0.2], dtype=np.float32)},
+        {"x": float("nan"), "inf": float("inf"), "a": np.array([np.nan, -np.inf])},
+    ],
+)
+def test_serializers_produce_identical_documents(monkeypatch, params):
+    if reproducibility.orjson is None:
+        pytest.skip("orjson not installed")
+    manifest = {"name": "café", "params": params}
+    fast = reproducibility._dump_json(manifest)
+    monkeypatch.setattr(reproducibility, "orjson", None)
+    assert reproducibility._dump_json(manifest) == fast
+
+
+def test_dump_json_keeps_non_finite_and_short_floats():
+    document = reproducibility._dump_json({"x": float("nan"), "y": np.float32(0.1)})
+    assert b'"x": NaN' in document
+    assert b'"y": 0.1\n' in document
+
+
+def test_verify_reproducibility_seeded():
+    assert verify_reproducibility(seeded_draw)
+    assert verify_reproducibility(lambda: [random.random() for _ in range(5)])
+
+
+def test_verify_reproducibility_stops_at_first_mismatch():
+    calls = []
+
+    def unseeded():
+        calls.append(None)
+        return time.perf_counter_ns()
+
+    assert not verify_reproducibility(unseeded, n_runs=5)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("deterministic", [False, True])
+def test_verify_reproducibility_deterministic_mode_is_opt_in(monkeypatch, deterministic):
+    entered = []
+
+    @contextlib.contextmanager
+    def recording_mode():
+        entered.append(None)
+        yield
+
+    monkeypatch.setattr(reproducibility, "deterministic_mode", recording_mode)
+    assert verify_reproducibility(seeded_draw, n_runs=2, deterministic=deterministic)
+    assert len(entered) == (2 if deterministic else 0)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_verify_reproducibility_rejects_zero_runs(parallel):
+    with pytest.raises(ValueError):
+        verify_reproducibility(seeded_draw, n_runs=0, parallel=parallel)
+
+
+def test_verify_reproducibility_parallel():
+    assert verify_reproducibility(seeded_draw, n_runs=2, parallel=True)
+    assert not verify_reproducibility(clock, n_runs=2, parallel=True)
+
+
+def test_verify_reproducibility_parallel_pins_hash_seed(monkeypatch):
+    monkeypatch.delenv("PYTHONHASHSEED", raising=False)
+    # Force one worker per run so each run gets its own interpreter
+    monkeypatch.setattr(reproducibility.os, "cpu_count", lambda: 4)
+    assert verify_reproducibility(hash_ordered, n_runs=4, parallel=True)
+    assert "PYTHONHASHSEED" not in reproducibility.os.environ
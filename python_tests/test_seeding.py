@@ -0,0 +1,75 @@
+"""Tests for scripts/_seeding.py."""
+import os
+import random
+
+import numpy as np
+import pytest
+
+from scripts import _seeding
+from scripts._seeding import deterministic_mode, get_rng, set_seed
+
+
+def test_set_seed_is_reproducible():
+    set_seed(123)
+    first = (random.random(), np.random.random(), get_rng().random())
+    set_seed(123)
+    assert (random.random(), np.random.random(), get_rng().random()) == first
+
+
+def test_set_seed_reports_numpy():
+    assert "NumPy" in set_seed(1)
+
+
+def test_set_seed_sets_pythonhashseed(monkeypatch):
+    monkeypatch.delenv("PYTHONHASHSEED", raising=False)
+    set_seed(99)
+    assert os.environ["PYTHONHASHSEED"] == "99"
+
+
+def test_get_rng_is_shared_and_reseeded():
+    set_seed(5)
+    rng = get_rng()
+    assert get_rng() is rng
+    expected = np.random.default_rng(5).random(3)
+    np.testing.assert_array_equal(rng.random(3), expected)
+
+
+def test_set_seed_records_jax_seed_without_building_key(monkeypatch):
+    monkeypatch.setattr(_seeding, "_has_jax", lambda: True)
+    monkeypatch.setattr(_seeding, "_JAX_KEY", object())
+    monkeypatch.setattr(_seeding, "_JAX_SEED", _seeding._JAX_SEED)
+    assert "JAX" in set_seed(11)
+    assert _seeding._JAX_SEED == 11
+    assert _seeding._JAX_KEY is None
+
+
+def test_get_jax_key_uses_last_seed():
+    jax = pytest.importorskip("jax")
+    set_seed(3)
+    assert (_seeding.get_jax_key() == jax.random.PRNGKey(3)).all()
+
+
+@pytest.mark.parametrize("previous", [None, ":16:8"])
+def test_deterministic_mode_restores_cublas_workspace(monkeypatch, previous):
+    if previous is None:
+        monkeypatch.delenv("CUBLAS_WORKSPACE_CONFIG", raising=False)
+    else:
+        monkeypatch.setenv("CUBLAS_WORKSPACE_CONFIG", previous)
+    with deterministic_mode():
+        assert os.environ["CUBLAS_WORKSPACE_CONFIG"] == ":4096:8"
+    assert os.environ.get("CUBLAS_WORKSPACE_CONFIG") == previous
+
+
+def test_deterministic_mode_restores_torch_flags():
+    torch = pytest.importorskip("torch")
+    torch.use_deterministic_algorithms(False)
+    torch.backends.cudnn.benchmark = True
+    with deterministic_mode():
+        assert torch.are_deterministic_algorithms_enabled()
+        assert not torch.backends.cudnn.benchmark
+    assert not torch.are_deterministic_algorithms_enabled()
+    assert torch.backends.cudnn.benchmark
+
+
+def test_seeded_rng_is_rewound(seeded_rng, reproducible_seed):
+    assert seeded_rng.random() == random.Random(reproducible_seed).random()
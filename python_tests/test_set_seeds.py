@@ -0,0 +1,30 @@
+"""Tests for scripts/set_seeds.py."""
+import inspect
+from pathlib import Path
+
+from scripts import set_seeds
+from scripts.set_seeds import set_all_seeds
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_set_seeds_module_single():
+    """set_all_seeds resolves to the one canonical scripts/set_seeds.py."""
+    source = Path(inspect.getsourcefile(set_all_seeds)).resolve()
+    assert source == REPO_ROOT / "scripts" / "set_seeds.py"
+    assert list((REPO_ROOT / "scripts").rglob("set_seeds.py")) == [source]
+
+
+def test_set_all_seeds_is_quiet_by_default(capsys):
+    set_all_seeds(7)
+    assert capsys.readouterr().out == ""
+
+
+def test_main_reports_seed_from_argv(capsys):
+    set_seeds.main(["7"])
+    assert capsys.readouterr().out.endswith("All seeds set to 7\n")
+
+
+def test_main_defaults_to_random_seed(capsys):
+    set_seeds.main([])
+    assert capsys.readouterr().out.endswith(f"All seeds set to {set_seeds.RANDOM_SEED}\n")
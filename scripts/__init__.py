@@ -0,0 +1 @@
+"""Presentar Python utilities: seed management and reproducibility helpers."""
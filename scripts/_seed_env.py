@@ -0,0 +1,20 @@
+"""Cached random seed configuration from the environment.
+
+F1: Random seed management - RANDOM_SEED and TEST_SEED are parsed once per
+process and shared by every consumer.
+"""
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=1)
+def load_seed_env() -> tuple[int, int]:
+    """Read RANDOM_SEED and TEST_SEED from the environment.
+
+    TEST_SEED inherits RANDOM_SEED when unset.
+
+    Returns:
+        Tuple of (random_seed, test_seed)
+    """
+    random_seed = os.environ.get("RANDOM_SEED", "42")
+    return int(random_seed), int(os.environ.get("TEST_SEED", random_seed))
@@ -0,0 +1,222 @@
+"""Random seed management shared by conftest.py and the scripts.
+
+F1 Criterion: Popperian falsifiability requires deterministic execution.
+This is the single implementation of seeding across Python ML libraries.
+"""
+import contextlib
+import functools
+import importlib.util
+import os
+import random
+from collections.abc import Iterator
+from typing import Any
+
+try:
+    from scripts._seed_env import load_seed_env
+except ModuleNotFoundError:  # imported from a script executed directly
+    from _seed_env import load_seed_env
+
+# F1: Random seed management
+RANDOM_SEED, TEST_SEED = load_seed_env()
+
+# Shared NumPy Generator, created lazily by get_rng() and refreshed by set_seed()
+_RNG: Any = None
+
+# Shared JAX PRNGKey, built lazily by get_jax_key() from the last set_seed() value
+_JAX_SEED = RANDOM_SEED
+_JAX_KEY: Any = None
+
+
+# Optional libraries are imported on first use and the result cached, so
+# importing this module stays cheap and later set_seed calls skip the probe.
+@functools.lru_cache(maxsize=1)
+def _numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@functools.lru_cache(maxsize=1)
+def _torch() -> Any:
+    """Return the torch module, or None if it is not installed."""
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch
+
+
+@functools.lru_cache(maxsize=1)
+def _tensorflow() -> Any:
+    """Return the tensorflow module, or None if it is not installed."""
+    try:
+        import tensorflow
+    except ImportError:
+        return None
+    return tensorflow
+
+
+@functools.lru_cache(maxsize=1)
+def _has_jax() -> bool:
+    """Check whether jax is installed without importing it.
+
+    Importing jax initializes XLA (and on GPU hosts preallocates device
+    memory), so the seed path only records the seed; get_jax_key() imports
+    jax when a key is actually needed.
+    """
+    return importlib.util.find_spec("jax") is not None
+
+
+def _set_numpy_seed(seed: int) -> bool:
+    """Set NumPy random seed (legacy global state and the shared Generator)."""
+    global _RNG
+    np = _numpy()
+    if np is None:
+        return False
+    np.random.seed(seed)
+    _RNG = np.random.default_rng(seed)
+    return True
+
+
+def _set_pytorch_seed(seed: int, deterministic: bool = False) -> bool:
+    """Set PyTorch random seeds (CPU and CUDA), optionally pinning cudnn."""
+    torch = _torch()
+    if torch is None:
+        return False
+    torch.manual_seed(seed)
+    if torch.cuda.is_available():
+        # manual_seed_all covers every device, including the current one
+        # that cuda.manual_seed would seed (see torch.cuda.random docs)
+        torch.cuda.manual_seed_all(seed)
+    if deterministic:
+        torch.backends.cudnn.deterministic = True
+        torch.backends.cudnn.benchmark = False
+    return True
+
+
+def _set_tensorflow_seed(seed: int) -> bool:
+    """Set TensorFlow random seed."""
+    tf = _tensorflow()
+    if tf is None:
+        return False
+    tf.random.set_seed(seed)
+    return True
+
+
+def _set_jax_seed(seed: int) -> bool:
+    """Record the seed for the shared JAX PRNGKey (JAX has no global random state)."""
+    global _JAX_SEED, _JAX_KEY
+    if not _has_jax():
+        return False
+    _JAX_SEED = seed
+    _JAX_KEY = None
+    return True
+
+
+def get_rng() -> Any:
+    """Get the shared NumPy random Generator.
+
+    New code should draw from this instead of the legacy global
+    ``np.random.*`` functions: it uses PCG64 and does not share state with
+    other libraries. set_seed() reseeds both, so either stays reproducible.
+
+    Returns:
+        numpy.random.Generator seeded with the last set_seed() value
+        (RANDOM_SEED if set_seed() has not been called)
+    """
+    global _RNG
+    if _RNG is None:
+        import numpy as np
+
+        _RNG = np.random.default_rng(RANDOM_SEED)
+    return _RNG
+
+
+def get_jax_key() -> Any:
+    """Get the shared JAX PRNGKey.
+
+    JAX functions take an explicit key; split this one with
+    ``jax.random.split`` rather than reusing it across draws.
+
+    Returns:
+        jax.random.PRNGKey for the last set_seed() value
+        (RANDOM_SEED if set_seed() has not been called)
+    """
+    global _JAX_KEY
+    if _JAX_KEY is None:
+        import jax
+
+        _JAX_KEY = jax.random.PRNGKey(_JAX_SEED)
+    return _JAX_KEY
+
+
+@contextlib.contextmanager
+def deterministic_mode() -> Iterator[None]:
+    """Force deterministic GPU kernels for the duration of a block.
+
+    Sets CUBLAS_WORKSPACE_CONFIG and, when PyTorch is installed, pins cudnn
+    to deterministic non-autotuned kernels and enables
+    torch.use_deterministic_algorithms. Previous settings are restored on
+    exit. Deterministic kernels can be much slower, so keep the block
+    limited to code whose output must be bit-for-bit reproducible.
+    """
+    prev_workspace = os.environ.get("CUBLAS_WORKSPACE_CONFIG")
+    os.environ["CUBLAS_WORKSPACE_CONFIG"] = ":4096:8"
+    torch = _torch()
+    if torch is not None:
+        cudnn = torch.backends.cudnn
+        prev_torch = (
+            cudnn.deterministic,
+            cudnn.benchmark,
+            torch.are_deterministic_algorithms_enabled(),
+            torch.is_deterministic_algorithms_warn_only_enabled(),
+        )
+        cudnn.deterministic = True
+        cudnn.benchmark = False
+        torch.use_deterministic_algorithms(True)
+    try:
+        yield
+    finally:
+        if torch is not None:
+            cudnn.deterministic, cudnn.benchmark, prev_algorithms, prev_warn_only = prev_torch
+            torch.use_deterministic_algorithms(prev_algorithms, warn_only=prev_warn_only)
+        if prev_workspace is None:
+            os.environ.pop("CUBLAS_WORKSPACE_CONFIG", None)
+        else:
+            os.environ["CUBLAS_WORKSPACE_CONFIG"] = prev_workspace
+
+
+def set_seed(seed: int = RANDOM_SEED, deterministic: bool = False) -> list[str]:
+    """Set all random seeds for reproducibility.
+
+    F1 Criterion: Random seed management.
+
+    Args:
+        seed: Random seed value (default: 42)
+        deterministic: Also pin cudnn to deterministic, non-benchmarked
+            kernels for the rest of the process (use deterministic_mode()
+            to scope this instead)
+
+    Returns:
+        Names of the optional libraries that were seeded
+    """
+    random.seed(seed)
+
+    # Environment for hash reproducibility (skip the write when unchanged)
+    seed_str = str(seed)
+    if os.environ.get("PYTHONHASHSEED") != seed_str:
+        os.environ["PYTHONHASHSEED"] = seed_str
+
+    seeded = []
+    if _set_numpy_seed(seed):
+        seeded.append("NumPy")
+    if _set_pytorch_seed(seed, deterministic):
+        seeded.append("PyTorch")
+    if _set_tensorflow_seed(seed):
+        seeded.append("TensorFlow")
+    if _set_jax_seed(seed):
+        seeded.append("JAX")
+    return seeded
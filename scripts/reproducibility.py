@@ -3,86 +3,238 @@
 
 F1/F2: ML Reproducibility - Seed management and model versioning.
 """
+import contextlib
 import hashlib
 import json
+import math
+import multiprocessing
 import os
-import random
-from datetime import datetime
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
-# F1: Global random seed configuration
-RANDOM_SEED = int(os.environ.get("RANDOM_SEED", "42"))
+# Optional fast JSON serializer (falls back to stdlib json)
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
+try:
+    from scripts._seeding import (
+        RANDOM_SEED,
+        TEST_SEED,
+        deterministic_mode,
+        get_jax_key,
+        get_rng,
+        set_seed,
+    )
+except ModuleNotFoundError:  # executed directly as `python scripts/reproducibility.py`
+    from _seeding import (
+        RANDOM_SEED,
+        TEST_SEED,
+        deterministic_mode,
+        get_jax_key,
+        get_rng,
+        set_seed,
+    )
 
+# F2: Environment versions recorded in every manifest (fixed per process)
+_PY_VER = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_NP_VER = np.__version__
 
-def set_seed(seed: int = RANDOM_SEED) -> None:
-    """Set all random seeds for reproducibility.
 
-    F1 Criterion: Random seed management.
+def get_seed() -> int:
+    """Get the current random seed.
 
-    Args:
-        seed: Random seed value (default: 42)
+    Returns:
+        Current seed value
     """
-    # Python random
-    random.seed(seed)
-
-    # NumPy random
-    np.random.seed(seed)
-
-    # Environment for hash reproducibility
-    os.environ["PYTHONHASHSEED"] = str(seed)
+    return RANDOM_SEED
 
-    # PyTorch (if available)
-    try:
-        import torch
-
-        torch.manual_seed(seed)
-        if torch.cuda.is_available():
-            torch.cuda.manual_seed(seed)
-            torch.cuda.manual_seed_all(seed)
-            torch.backends.cudnn.deterministic = True
-            torch.backends.cudnn.benchmark = False
-    except ImportError:
-        pass
-
-    # TensorFlow (if available)
-    try:
-        import tensorflow as tf
 
-        tf.random.set_seed(seed)
-    except ImportError:
-        pass
+def _fingerprint(result: Any) -> Any:
+    """Reduce a result to a compact value for run-to-run comparison.
 
+    NumPy arrays and numeric lists/tuples are hashed from their raw bytes,
+    so comparison is a digest check instead of an elementwise Python walk.
+    Sequences that NumPy cannot convert losslessly, and anything else, are
+    returned unchanged and compared with ``==``.
 
-def get_seed() -> int:
-    """Get the current random seed.
+    Args:
+        result: Value returned by the function under test
 
     Returns:
-        Current seed value
+        SHA-256 digest for numeric array-likes, otherwise the result itself
     """
-    return RANDOM_SEED
+    if isinstance(result, (list, tuple)):
+        try:
+            array = np.asarray(result)
+        except ValueError:  # ragged sequence
+            return result
+        # Mixed or non-numeric sequences would be coerced to one dtype
+        # (e.g. [1, "a"] -> ["1", "a"]), so compare the original value
+        if array.dtype.kind not in "biufc":
+            return result
+        # Only hash when the conversion is lossless: large ints mixed with
+        # floats round to float64 (e.g. [2**60 + 1, 0.1] -> [2**60, 0.1])
+        if array.tolist() != list(result):
+            return result
+    elif isinstance(result, np.ndarray):
+        array = result
+        if array.dtype.kind not in "biufc":
+            return array.tolist()
+    else:
+        return result
+    digest = hashlib.sha256(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.digest()
+
+
+def _run_fingerprint(func, seed: int, deterministic: bool = False) -> Any:
+    """Seed, call func and fingerprint its result (one verification run)."""
+    with deterministic_mode() if deterministic else contextlib.nullcontext():
+        set_seed(seed)
+        return _fingerprint(func())
 
 
-def verify_reproducibility(func, n_runs: int = 3, seed: int = RANDOM_SEED) -> bool:
+def verify_reproducibility(
+    func,
+    n_runs: int = 3,
+    seed: int = RANDOM_SEED,
+    parallel: bool = False,
+    deterministic: bool = False,
+) -> bool:
     """Verify that a function produces reproducible results.
 
     Args:
         func: Function to test
         n_runs: Number of runs to compare
         seed: Seed to use
+        parallel: Run each call in its own freshly spawned process. Only
+            worth it for CPU-heavy functions; func must be picklable
+            (defined at module level) and its result too.
+        deterministic: Run each call inside deterministic_mode(). Ops
+            without a deterministic GPU kernel then raise RuntimeError.
 
     Returns:
-        True if all runs produce identical results
+        True if all runs produce identical results (sequential runs stop
+        at the first run that differs from the first one)
+
+    Raises:
+        ValueError: If n_runs is less than 1
     """
-    results = []
-    for _ in range(n_runs):
-        set_seed(seed)
-        result = func()
-        results.append(result)
+    if n_runs < 1:
+        raise ValueError(f"n_runs must be at least 1, got {n_runs}")
+
+    if parallel:
+        # spawn, not fork: a forked child inherits thread pool and RNG state
+        context = multiprocessing.get_context("spawn")
+        max_workers = min(n_runs, os.cpu_count() or 1)
+        # The hash seed is fixed at interpreter startup, so set_seed inside a
+        # worker is too late; spawned workers inherit it from our environment
+        prev_hash_seed = os.environ.get("PYTHONHASHSEED")
+        os.environ["PYTHONHASHSEED"] = str(seed)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+                fingerprints = list(
+                    executor.map(
+                        _run_fingerprint, [func] * n_runs, [seed] * n_runs, [deterministic] * n_runs
+                    )
+                )
+        finally:
+            if prev_hash_seed is None:
+                os.environ.pop("PYTHONHASHSEED", None)
+            else:
+                os.environ["PYTHONHASHSEED"] = prev_hash_seed
+        return all(fp == fingerprints[0] for fp in fingerprints)
+
+    reference = _run_fingerprint(func, seed, deterministic)
+    for _ in range(n_runs - 1):
+        if _run_fingerprint(func, seed, deterministic) != reference:
+            return False
+
+    return True
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as a file-name-safe timestamp.
+
+    Time fields are separated by "-" rather than ":" so the value can be
+    used in manifest file names as-is.
+
+    Returns:
+        Timestamp such as 2025-01-31T12-00-00.123456789Z
+    """
+    secs, nanos = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.gmtime(secs)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}-{tm.tm_min:02d}-{tm.tm_sec:02d}.{nanos:09d}Z"
+    )
+
 
-    return all(r == results[0] for r in results)
+def _json_key(key: Any) -> str:
+    """Convert a dict key to the string JSON writes for it.
+
+    Args:
+        key: Dict key
+
+    Returns:
+        JSON object key
+
+    Raises:
+        TypeError: If JSON cannot use the key
+    """
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, float)):
+        return json.dumps(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _update_digest(digest: "hashlib._Hash", value: Any) -> None:
+    """Feed a value into a hash in canonical JSON form.
+
+    Streams key/value pairs into the digest instead of serializing the
+    whole structure to one string first. Keys are converted and sorted and
+    leaves encoded the way the saved JSON document writes them, so the
+    checksum can be re-computed from a loaded manifest.
+
+    Args:
+        digest: Hash object to update
+        value: Manifest value (dicts and sequences are walked recursively)
+
+    Raises:
+        TypeError: If the value is not JSON serializable
+    """
+    if isinstance(value, (np.generic, np.ndarray)):
+        value = _json_default(value)
+    if isinstance(value, dict):
+        digest.update(b"{")
+        for key, item in sorted(
+            ((_json_key(key), item) for key, item in value.items()), key=lambda pair: pair[0]
+        ):
+            digest.update(json.dumps(key).encode())
+            digest.update(b":")
+            _update_digest(digest, item)
+            digest.update(b",")
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _update_digest(digest, item)
+            digest.update(b",")
+        digest.update(b"]")
+    else:
+        digest.update(json.dumps(value).encode())
 
 
 def create_experiment_manifest(
@@ -104,21 +256,76 @@ def create_experiment_manifest(
     """
     manifest = {
         "name": name,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _utc_timestamp(),
         "seed": seed,
-        "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}",
-        "numpy_version": np.__version__,
+        "python_version": _PY_VER,
+        "numpy_version": _NP_VER,
         "params": params or {},
         "reproducible": True,
     }
 
     # Add checksum for verification
-    manifest_str = json.dumps(manifest, sort_keys=True)
-    manifest["checksum"] = hashlib.sha256(manifest_str.encode()).hexdigest()[:16]
+    digest = hashlib.sha256()
+    _update_digest(digest, manifest)
+    manifest["checksum"] = digest.hexdigest()[:16]
 
     return manifest
 
 
+def _json_default(value: Any) -> Any:
+    """Convert NumPy values for stdlib json, as orjson's OPT_SERIALIZE_NUMPY does.
+
+    float16/float32 values use their shortest repr, so np.float32(0.1) is
+    written as 0.1 rather than 0.10000000149011612.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and value.dtype.itemsize < 8:
+            if value.ndim == 0:
+                return _json_default(value[()])
+            return [_json_default(item) for item in value]
+        return value.tolist()
+    if isinstance(value, np.floating) and value.dtype.itemsize < 8:
+        return float(str(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _all_finite(value: Any) -> bool:
+    """Check that a manifest value holds no NaN or infinite floats."""
+    if isinstance(value, dict):
+        return all(_all_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_all_finite(item) for item in value)
+    if isinstance(value, (float, np.floating)):
+        return math.isfinite(value)
+    if isinstance(value, np.ndarray) and value.dtype.kind in "fc":
+        return bool(np.isfinite(value).all())
+    return True
+
+
+def _dump_json(manifest: dict[str, Any]) -> bytes:
+    """Serialize a manifest to indented JSON bytes.
+
+    Uses orjson when installed, otherwise the stdlib json module; both
+    accept non-str keys and NumPy values and produce the same document.
+    orjson writes NaN/Infinity as null, so manifests holding non-finite
+    floats always go through json, which keeps them as NaN/Infinity.
+
+    Args:
+        manifest: Experiment manifest
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None and _all_finite(manifest):
+        try:
+            return orjson.dumps(manifest, option=_ORJSON_OPTIONS)
+        except TypeError:  # e.g. keys or values orjson cannot encode
+            pass
+    return json.dumps(manifest, indent=2, ensure_ascii=False, default=_json_default).encode()
+
+
 def save_experiment(manifest: dict[str, Any], output_dir: Path | str = "experiments") -> Path:
     """Save experiment manifest to disk.
 
@@ -130,13 +337,23 @@ def save_experiment(manifest: dict[str, Any], output_dir: Path | str = "experime
         Path to saved manifest
     """
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    filename = f"{manifest['name']}_{manifest['timestamp'].replace(':', '-')}.json"
+    filename = f"{manifest['name']}_{manifest['timestamp']}.json"
     output_path = output_dir / filename
+    payload = memoryview(_dump_json(manifest))
 
-    with open(output_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    # Write with raw fds: manifests are small, so skip TextIOWrapper/buffering.
+    # The directory is only created when the first open finds it missing.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(output_path, flags, 0o644)
+    except FileNotFoundError:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(output_path, flags, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
 
     return output_path
 
@@ -147,7 +364,7 @@ if __name__ == "__main__":
 
     # Verify reproducibility
     def sample_random():
-        return [random.random() for _ in range(10)]
+        return get_rng().random(10).tolist()
 
     is_reproducible = verify_reproducibility(sample_random)
     print(f"Reproducibility verified: {is_reproducible}")
@@ -158,4 +375,4 @@ if __name__ == "__main__":
         seed=42,
         params={"learning_rate": 0.001, "batch_size": 32},
     )
-    print(f"Manifest: {json.dumps(manifest, indent=2)}")
+    print(f"Manifest: {_dump_json(manifest).decode()}")
@@ -4,73 +4,38 @@
 F1 Criterion: Popperian falsifiability requires deterministic execution.
 This script sets all random seeds across Python ML libraries.
 """
-import os
-import random
+import sys
 
-# F1: Random seed management
-RANDOM_SEED = int(os.environ.get("RANDOM_SEED", "42"))
+try:
+    from scripts._seeding import RANDOM_SEED, set_seed
+except ModuleNotFoundError:  # executed directly as `python scripts/set_seeds.py`
+    from _seeding import RANDOM_SEED, set_seed
 
 
-def _set_numpy_seed(seed: int) -> None:
-    """Set NumPy random seed."""
-    try:
-        import numpy as np
-        np.random.seed(seed)
-        print(f"NumPy seed set to {seed}")
-    except ImportError:
-        pass
-
-
-def _set_pytorch_seed(seed: int) -> None:
-    """Set PyTorch random seeds (CPU and CUDA)."""
-    try:
-        import torch
-        torch.manual_seed(seed)
-        if torch.cuda.is_available():
-            torch.cuda.manual_seed(seed)
-            torch.cuda.manual_seed_all(seed)
-            torch.backends.cudnn.deterministic = True
-            torch.backends.cudnn.benchmark = False
-        print(f"PyTorch seed set to {seed}")
-    except ImportError:
-        pass
-
-
-def _set_tensorflow_seed(seed: int) -> None:
-    """Set TensorFlow random seed."""
-    try:
-        import tensorflow as tf
-        tf.random.set_seed(seed)
-        print(f"TensorFlow seed set to {seed}")
-    except ImportError:
-        pass
-
+def set_all_seeds(seed: int = RANDOM_SEED, verbose: bool = False) -> None:
+    """Set all random seeds for complete reproducibility.
 
-def _set_jax_seed(seed: int) -> None:
-    """Document JAX PRNGKey pattern."""
-    try:
-        import jax
-        print(f"JAX: Use jax.random.PRNGKey({seed})")
-    except ImportError:
-        pass
+    Args:
+        seed: Random seed value (default: 42)
+        verbose: Report the seeded libraries on stdout
+    """
+    seeded = set_seed(seed)
+    if verbose:
+        lines = [f"{library} seed set to {seed}" for library in seeded]
+        lines.append(f"All seeds set to {seed}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def set_all_seeds(seed: int = RANDOM_SEED) -> None:
-    """Set all random seeds for complete reproducibility.
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point: ``set-seeds [SEED]``.
 
     Args:
-        seed: Random seed value (default: 42)
+        argv: Arguments after the program name (default: sys.argv[1:])
     """
-    random.seed(seed)
-    os.environ["PYTHONHASHSEED"] = str(seed)
-    _set_numpy_seed(seed)
-    _set_pytorch_seed(seed)
-    _set_tensorflow_seed(seed)
-    _set_jax_seed(seed)
-    print(f"All seeds set to {seed}")
+    args = sys.argv[1:] if argv is None else argv
+    seed = int(args[0]) if args else RANDOM_SEED
+    set_all_seeds(seed, verbose=True)
 
 
 if __name__ == "__main__":
-    import sys
-    seed = int(sys.argv[1]) if len(sys.argv) > 1 else RANDOM_SEED
-    set_all_seeds(seed)
+    main()
@@ -3,14 +3,7 @@
 
 B1/F1: Reproducibility and random seed management.
 """
-import os
-import random
-
-from setuptools import setup, find_packages
-
-# F1: Set random seed for reproducible builds
-RANDOM_SEED = int(os.environ.get("RANDOM_SEED", "42"))
-random.seed(RANDOM_SEED)
+from setuptools import setup
 
 setup(
     name="presentar",
@@ -19,7 +12,7 @@ setup(
     author="PAIML",
     author_email="dev@paiml.com",
     python_requires=">=3.11",
-    packages=find_packages(exclude=["tests*"]),
+    packages=["scripts"],
     install_requires=[
         "numpy>=1.26.0",
     ],
@@ -32,10 +25,13 @@ setup(
         "ml": [
             "torch>=2.1.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
-            "set-seeds=scripts.set_seeds:set_all_seeds",
+            "set-seeds=scripts.set_seeds:main",
         ],
     },
 )